@@ -1,8 +1,27 @@
 import re
+import sys
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any, Callable, Optional, Type
 
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic import ConfigDict, PrivateAttr, TypeAdapter, field_validator
+
+_OUTPUT_RE = re.compile(r"\ACall:\s*(?P<call>.*?)\nThought:\s*(?P<thought>.*)\Z", re.DOTALL)
+_CALL_PREFIX = "Call: "
+_CALL_PREFIX_LEN = len(_CALL_PREFIX)
+_THOUGHT_DELIMITER = "\nThought: "
+_RE_RETURNS = re.compile(r"\s*Returns:")
+_RE_ARGS = re.compile(r"\s*Args:")
+_RE_ARG_LINE = re.compile(r"\s*(\w+) \(\w+\):")
+_NL = "\n"
+
+_SIG_FMT: dict[tuple[bool, bool], Callable[[str, str, Any], str]] = {
+    (False, False): lambda name, type_name, default: f"{name}: {type_name} = {default}",
+    (False, True): lambda name, type_name, default: f"{name}: {type_name}",
+    (True, False): lambda name, type_name, default: f"{name} = {default}",
+    (True, True): lambda name, type_name, default: name,
+}
 
 
 class BaseError(Exception):
@@ -13,23 +32,27 @@ class ParseError(BaseError, ValueError):
     pass
 
 
-class BaseModel(PydanticBaseModel): ...
+class BaseModel(PydanticBaseModel):
+    model_config = ConfigDict(frozen=True, validate_assignment=False, arbitrary_types_allowed=True, extra="forbid")
+
 
+class Output:
+    __slots__ = ("call", "thought")
 
-class Output(BaseModel):
     call: str
     thought: str
 
+    def __init__(self, call: str, thought: str) -> None:
+        self.call = call
+        self.thought = thought
+
     def __str__(self) -> str:
         """
         Return the string representation of the output.
 
         Returns:
             str: The string representation of the output.
-
-        >>> print(str(Output(call="add(1, 1)", thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')))
-        Output(call='add(1, 1)', thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')
-        """  # noqa: E501
+        """
         return f"Output(call='{self.call}', thought='{self.thought}')"
 
     def __repr__(self) -> str:
@@ -38,10 +61,7 @@ class Output(BaseModel):
 
         Returns:
             str: The string representation of the output.
-
-        >>> print(repr(Output(call="add(1, 1)", thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')))
-        Output(call='add(1, 1)', thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')
-        """  # noqa: E501
+        """
         return self.__str__()
 
     @classmethod
@@ -54,33 +74,39 @@ class Output(BaseModel):
 
         Returns:
             Output: The parsed output.
-
-        >>> Output.parse('Call: add (a=1, b=1) \\nThought: The function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" because it passes the values 1 and 1 to the `add` function, which adds them together and returns the result.\\n\\nThe `add` function takes two integer arguments, `a` and `b`, and returns their sum. In this case, the function is called with the values `a=1` and `b=1`, which means the function will return the sum of 1 and 1, which is 2.\\n\\nTherefore, the function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" by returning the value 2, which is the result of adding 1 and 1 together.')
-        Output(call='add (a=1, b=1)', thought='The function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" because it passes the values 1 and 1 to the `add` function, which adds them together and returns the result.
-        <BLANKLINE>
-        The `add` function takes two integer arguments, `a` and `b`, and returns their sum. In this case, the function is called with the values `a=1` and `b=1`, which means the function will return the sum of 1 and 1, which is 2.
-        <BLANKLINE>
-        Therefore, the function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" by returning the value 2, which is the result of adding 1 and 1 together.')
-        """  # noqa: E501
-        chunks = output.split(chr(10))
-        call = ""
-        thought = ""
-        call_end = False
-        for chunk in chunks:
-            if chunk.startswith("Thought: "):
-                call_end = True
-                thought += chunk[len("Thought: ") :]
-            elif call_end:
-                thought += f"\n{chunk}"
-            elif chunk.startswith("Call: "):
-                call += chunk[len("Call: ") :]
-            else:
-                call += f"\n{chunk}"
-        call = call.strip()
+        """
+        if not output or ("Call:" not in output and "Thought:" not in output):
+            raise ParseError(output)
+        head, sep, tail = output.partition(_THOUGHT_DELIMITER)
+        if sep and tail and head.startswith(_CALL_PREFIX):
+            call = head[_CALL_PREFIX_LEN:].strip()
+            if call:
+                return cls(call=call, thought=tail)
+        match = _OUTPUT_RE.match(output)
+        if match is None:
+            raise ParseError(output)
+        call = match.group("call").strip()
+        thought = match.group("thought")
         if not call or not thought:
             raise ParseError(output)
         return cls(call=call, thought=thought)
 
+    @classmethod
+    def parse_many(cls, outputs: Sequence[str]) -> list["Output"]:
+        """
+        Parse a batch of outputs from LLM.
+
+        Args:
+            outputs (Sequence[str]): The outputs from LLM.
+
+        Returns:
+            list[Output]: The parsed outputs.
+
+        >>> Output.parse_many(["Call: add(a=1, b=1)\\nThought: It adds 1 and 1."])
+        [Output(call='add(a=1, b=1)', thought='It adds 1 and 1.')]
+        """
+        return [cls.parse(output) for output in outputs]
+
 
 class Argument(BaseModel):
     name: str
@@ -88,40 +114,43 @@ class Argument(BaseModel):
     description: Optional[str] = None
     default: Optional[Any] = None
 
+    _str_cache: Optional[str] = PrivateAttr(default=None)
+    _signature_cache: Optional[str] = PrivateAttr(default=None)
+    _type_name: Optional[str] = PrivateAttr(default=None)
+
+    def _get_type_name(self) -> str:
+        if self._type_name is None:
+            self._type_name = "Any" if self.type is None else sys.intern(self.type.__name__)
+        return self._type_name
+
     def __str__(self) -> str:
         """
         Return the string representation of the argument.
 
         Returns:
             str: The string representation of the argument.
-
-        >>> str(Argument(name="a", type=int, description="The first argument."))
-        'a (int): The first argument.'
-        >>> str(Argument(name="b", type=int, description="The second argument.", default=1))
-        'b (:obj:`int`, optional): The second argument.'
-        >>> str(Argument(name="nodescription", type=int))
-        'nodescription (int)'
-        >>> str(Argument(name="notypenodescription"))
-        'notypenodescription'
-        >>> str(Argument(name="notypewithdefault", default=1))
-        'notypewithdefault (:obj:`Any`, optional)'
         """
+        if self._str_cache is None:
+            self._str_cache = self._build_str()
+        return self._str_cache
+
+    def _build_str(self) -> str:
         if self.default is None:
             if self.type is None:
                 if self.description is None:
                     return self.name
                 return f"{self.name}: {self.description}"
             if self.description is None:
-                return f"{self.name} ({self.type.__name__})"
-            return f"{self.name} ({self.type.__name__}): {self.description}"
+                return f"{self.name} ({self._get_type_name()})"
+            return f"{self.name} ({self._get_type_name()}): {self.description}"
         else:
             if self.type is None:
                 if self.description is None:
                     return f"{self.name} (:obj:`Any`, optional)"
                 return f"{self.name} (:obj:`Any`, optional):" f" {self.description}"
             if self.description is None:
-                return f"{self.name} (:obj:`{self.type.__name__}`, optional)"
-            return f"{self.name} (:obj:`{self.type.__name__}`, optional):" f" {self.description}"
+                return f"{self.name} (:obj:`{self._get_type_name()}`, optional)"
+            return f"{self.name} (:obj:`{self._get_type_name()}`, optional):" f" {self.description}"
 
     @property
     def signature(self) -> str:
@@ -130,22 +159,31 @@ class Argument(BaseModel):
 
         Returns:
             str: The signature of the argument.
+        """
+        if self._signature_cache is None:
+            self._signature_cache = _SIG_FMT[(self.type is None, self.default is None)](
+                self.name, self._get_type_name(), self.default
+            )
+        return self._signature_cache
 
-        >>> Argument(name="a", type=int, description="The first argument.").signature
-        'a: int'
-        >>> Argument(name="b", type=int, description="The second argument.", default=1).signature
-        'b: int = 1'
-        >>> Argument(name="nodescription", type=int).signature
-        'nodescription: int'
-        >>> Argument(name="notypenodescription").signature
-        'notypenodescription'
-        >>> Argument(name="notypewithdefault", default=1).signature
-        'notypewithdefault = 1'
+    @classmethod
+    def parse_many(cls, items: Sequence[Any]) -> list["Argument"]:
         """
-        return (
-            f"{self.name}{f': {self.type.__name__}' if self.type else ''}"
-            f"{f' = {self.default}' if self.default is not None else ''}"
-        )
+        Validate a batch of arguments in a single pydantic-core pass.
+
+        Args:
+            items (Sequence[Any]): The raw argument data.
+
+        Returns:
+            list[Argument]: The validated arguments.
+
+        >>> Argument.parse_many([{"name": "a", "type": int}])
+        [Argument(name='a', type=<class 'int'>, description=None, default=None)]
+        """
+        return _ARGUMENT_LIST_ADAPTER.validate_python(items)
+
+
+_ARGUMENT_LIST_ADAPTER: TypeAdapter[list[Argument]] = TypeAdapter(list[Argument])
 
 
 class Function(BaseModel):
@@ -155,8 +193,18 @@ class Function(BaseModel):
     return_type: Optional[Type[Any]] = None
     return_description: Optional[str] = None
 
+    _str_cache: Optional[str] = PrivateAttr(default=None)
+    _return_type_name: Optional[str] = PrivateAttr(default=None)
+
+    @field_validator("arguments", mode="before")
+    @classmethod
+    def _coerce_arguments(cls, value: Sequence[Any]) -> tuple[Any, ...]:
+        return tuple(value)
+
     def get_return_type_str(self) -> str:
-        return "Any" if self.return_type is None else self.return_type.__name__
+        if self._return_type_name is None:
+            self._return_type_name = "Any" if self.return_type is None else sys.intern(self.return_type.__name__)
+        return self._return_type_name
 
     def __str__(self) -> str:
         """
@@ -164,37 +212,29 @@ class Function(BaseModel):
 
         Returns:
             str: The string representation of the function.
+        """
+        if self._str_cache is None:
+            self._str_cache = self._build_str()
+        return self._str_cache
 
-        >>> print(str(Function(name="foo", description="The foo function.", arguments=[Argument(name="a", type=int, description="The first argument.")], return_type=str, return_description="The return value.")))
-        Function:
-        def foo(a: int) -> str:
-            \"\"\"
-            The foo function.
-        <BLANKLINE>
-            Args:
-                a (int): The first argument.
-        <BLANKLINE>
-            Returns:
-                str: The return value.
-            \"\"\"
-        <BLANKLINE>
-        """  # noqa: E501
+    def _build_str(self) -> str:
+        return_type_name = self.get_return_type_str()
         return (
             f"""\
 Function:
-def {self.name}({', '.join([argument.signature for argument in self.arguments])}) -> {self.get_return_type_str()}:
-    \"\"\"{(chr(10) + "    " + self.description + chr(10)) if self.description else ""}"""
+def {self.name}({', '.join(argument.signature for argument in self.arguments)}) -> {return_type_name}:
+    \"\"\"{(_NL + "    " + self.description + _NL) if self.description else ""}"""
             + (
                 f"""
     Args:
-        {chr(10).join([str(argument) for argument in self.arguments])}
+        {_NL.join(str(argument) for argument in self.arguments)}
 """
                 if len(self.arguments) > 0
                 else ""
             )
             + f"""
     Returns:
-        {self.get_return_type_str()}: {self.return_description or '(no description provided)'}
+        {return_type_name}: {self.return_description or '(no description provided)'}
     \"\"\"
 """
         )
@@ -234,66 +274,88 @@ def {self.name}({', '.join([argument.signature for argument in self.arguments])}
             \"\"\"
         <BLANKLINE>
         """
-        parameters = function.__code__.co_varnames[: function.__code__.co_argcount]
-        docstring_lines = (function.__doc__ or "").split(chr(10))
-        arg_description_map = {}
-        return_description = ""
-        for i, line in enumerate(docstring_lines):
-            if re.match(r"\s*Returns:", line) and i + 1 < len(docstring_lines):
-                return_description = docstring_lines[i + 1].split(": ")[-1]
-                break
-        parsing_args = False
-        for line in docstring_lines:
-            if re.match(r"\s*Args:", line):
-                parsing_args = True
-            elif parsing_args and re.match(r"\s*\w+ \(\w+\):", line):
-                arg_description_map[line.strip().split(" ")[0]] = line.split(": ")[-1]
-            elif parsing_args and re.match(r"\s*", line):
+        return _from_function_cached(function)
+
+    @classmethod
+    def parse_many(cls, items: Sequence[Any]) -> list["Function"]:
+        """
+        Validate a batch of functions in a single pydantic-core pass.
+
+        Args:
+            items (Sequence[Any]): The raw function data.
+
+        Returns:
+            list[Function]: The validated functions.
+
+        >>> Function.parse_many([{"name": "foo", "arguments": []}])
+        [Function(name='foo', description=None, arguments=(), return_type=None, return_description=None)]
+        """
+        return _FUNCTION_LIST_ADAPTER.validate_python(items)
+
+
+_FUNCTION_LIST_ADAPTER: TypeAdapter[list[Function]] = TypeAdapter(list[Function])
+
+
+@lru_cache(maxsize=256)
+def _from_function_cached(function: Callable[[Any], Any]) -> Function:
+    parameters = function.__code__.co_varnames[: function.__code__.co_argcount]
+    docstring_lines = (function.__doc__ or "").split(_NL)
+    arguments_by_name: dict[str, Argument] = {}
+    return_description = ""
+    parsing_args = False
+    returns_found = False
+    for i, line in enumerate(docstring_lines):
+        if _RE_ARGS.match(line):
+            parsing_args = True
+            continue
+        if parsing_args:
+            arg_match = _RE_ARG_LINE.match(line)
+            if arg_match is None:
                 parsing_args = False
-        return cls(
-            name=function.__name__,
-            description=docstring_lines[0],
-            arguments=[
-                Argument(
-                    name=parameter,
+            else:
+                argument_name = arg_match.group(1)
+                arguments_by_name[argument_name] = Argument.model_construct(
+                    name=argument_name,
                     type=int,
-                    description=arg_description_map.get(parameter, ""),
+                    description=line.rsplit(": ", 1)[-1],
                     default=None,
                 )
-                for parameter in parameters
-            ],
-            return_type=function.__annotations__["return"],
-            return_description=return_description,
-        )
+                continue
+        if not returns_found and _RE_RETURNS.match(line) and i + 1 < len(docstring_lines):
+            return_description = docstring_lines[i + 1].rsplit(": ", 1)[-1]
+            returns_found = True
+    return Function.model_construct(
+        name=function.__name__,
+        description=docstring_lines[0],
+        arguments=tuple(
+            arguments_by_name.get(parameter)
+            or Argument.model_construct(name=parameter, type=int, description="", default=None)
+            for parameter in parameters
+        ),
+        return_type=function.__annotations__["return"],
+        return_description=return_description,
+    )
 
 
 class PromptTemplate(BaseModel):
     functions: Sequence[Function]
 
+    _cached_str: Optional[str] = PrivateAttr(default=None)
+    _prefix: Optional[str] = PrivateAttr(default=None)
+    _suffix: Optional[str] = PrivateAttr(default=None)
+
     def __str__(self) -> str:
         """
         Return the string representation of the prompt template.
 
         Returns:
             str: The string representation of the prompt template.
-
-        >>> print(str(PromptTemplate(functions=[Function(name="foo", description="The foo function.", arguments=[Argument(name="a", type=int, description="The first argument.")], return_type=str, return_description="The return value.")])))
-        Function:
-        def foo(a: int) -> str:
-            \"\"\"
-            The foo function.
-        <BLANKLINE>
-            Args:
-                a (int): The first argument.
-        <BLANKLINE>
-            Returns:
-                str: The return value.
-            \"\"\"
-        <BLANKLINE>
-        User Query: {user_query}
-        """  # noqa: E501
-        return f"""{chr(10).join([str(function) for function in self.functions])}
-User Query: {{user_query}}"""
+        """
+        if self._cached_str is None:
+            parts = [str(function) for function in self.functions]
+            parts.append("User Query: {user_query}")
+            self._cached_str = _NL.join(parts)
+        return self._cached_str
 
     def format(self, user_query: str) -> str:
         """
@@ -320,7 +382,9 @@ User Query: {{user_query}}"""
         <BLANKLINE>
         User Query: pass foo to a string 'bar'
         """  # noqa: E501
-        return self.__str__().format(user_query=user_query)
+        if self._prefix is None or self._suffix is None:
+            self._prefix, _, self._suffix = self.__str__().partition("{user_query}")
+        return f"{self._prefix}{user_query}{self._suffix}"
 
     def render(self, user_query: str) -> str:
         """
@@ -66,6 +66,36 @@ Here are some reasons why your order fulfillment needs an outsourcing partner:
         assert False
 
 
+def test_output_parse_falls_back_to_regex_for_unspaced_call_prefix() -> None:
+
+    output = "Call:add(a=1)\nThought: ok"
+    parsed = Output.parse(output)
+    assert parsed.call == "add(a=1)"
+    assert parsed.thought == "ok"
+
+
+def test_output_parse_raises_parse_error_when_text_precedes_call() -> None:
+
+    output = "preamble\nCall: f()\nThought: ok"
+    try:
+        Output.parse(output)
+    except ParseError as e:
+        assert str(e) == output
+    else:
+        assert False
+
+
+def test_output_parse_raises_parse_error_when_thought_has_no_call() -> None:
+
+    output = "Thought: only"
+    try:
+        Output.parse(output)
+    except ParseError as e:
+        assert str(e) == output
+    else:
+        assert False
+
+
 def test_function_no_return_description() -> None:
     assert (
         str(
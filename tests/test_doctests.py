@@ -0,0 +1,112 @@
+"""Doctest examples for the hot-path rendering methods of :mod:`nexusravenv2utils.core`.
+
+The examples used to live in the docstrings of the methods themselves; they are
+kept here so the package modules stay small while pytest's ``--doctest-modules``
+still executes them.
+"""
+
+from nexusravenv2utils.core import (  # noqa: F401
+    Argument,
+    Function,
+    Output,
+    PromptTemplate,
+)
+
+
+def output_str_examples() -> None:
+    """
+    Examples for ``Output.__str__`` and ``Output.__repr__``.
+
+    >>> print(str(Output(call="add(1, 1)", thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')))
+    Output(call='add(1, 1)', thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')
+    >>> print(repr(Output(call="add(1, 1)", thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')))
+    Output(call='add(1, 1)', thought='The function call `add(1, 1)` answers the question "What is 1 plus 1?" by adding 1 and 1.')
+    """  # noqa: E501
+
+
+def output_parse_examples() -> None:
+    """
+    Examples for ``Output.parse``.
+
+    >>> Output.parse('Call: add (a=1, b=1) \\nThought: The function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" because it passes the values 1 and 1 to the `add` function, which adds them together and returns the result.\\n\\nThe `add` function takes two integer arguments, `a` and `b`, and returns their sum. In this case, the function is called with the values `a=1` and `b=1`, which means the function will return the sum of 1 and 1, which is 2.\\n\\nTherefore, the function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" by returning the value 2, which is the result of adding 1 and 1 together.')
+    Output(call='add (a=1, b=1)', thought='The function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" because it passes the values 1 and 1 to the `add` function, which adds them together and returns the result.
+    <BLANKLINE>
+    The `add` function takes two integer arguments, `a` and `b`, and returns their sum. In this case, the function is called with the values `a=1` and `b=1`, which means the function will return the sum of 1 and 1, which is 2.
+    <BLANKLINE>
+    Therefore, the function call `add (a=1, b=1) ` answers the question "What is 1 plus 1?" by returning the value 2, which is the result of adding 1 and 1 together.')
+    """  # noqa: E501
+
+
+def argument_str_examples() -> None:
+    """
+    Examples for ``Argument.__str__``.
+
+    >>> str(Argument(name="a", type=int, description="The first argument."))
+    'a (int): The first argument.'
+    >>> str(Argument(name="b", type=int, description="The second argument.", default=1))
+    'b (:obj:`int`, optional): The second argument.'
+    >>> str(Argument(name="nodescription", type=int))
+    'nodescription (int)'
+    >>> str(Argument(name="notypenodescription"))
+    'notypenodescription'
+    >>> str(Argument(name="notypewithdefault", default=1))
+    'notypewithdefault (:obj:`Any`, optional)'
+    """
+
+
+def argument_signature_examples() -> None:
+    """
+    Examples for ``Argument.signature``.
+
+    >>> Argument(name="a", type=int, description="The first argument.").signature
+    'a: int'
+    >>> Argument(name="b", type=int, description="The second argument.", default=1).signature
+    'b: int = 1'
+    >>> Argument(name="nodescription", type=int).signature
+    'nodescription: int'
+    >>> Argument(name="notypenodescription").signature
+    'notypenodescription'
+    >>> Argument(name="notypewithdefault", default=1).signature
+    'notypewithdefault = 1'
+    """
+
+
+def function_str_examples() -> None:
+    """
+    Examples for ``Function.__str__``.
+
+    >>> print(str(Function(name="foo", description="The foo function.", arguments=[Argument(name="a", type=int, description="The first argument.")], return_type=str, return_description="The return value.")))
+    Function:
+    def foo(a: int) -> str:
+        \"\"\"
+        The foo function.
+    <BLANKLINE>
+        Args:
+            a (int): The first argument.
+    <BLANKLINE>
+        Returns:
+            str: The return value.
+        \"\"\"
+    <BLANKLINE>
+    """  # noqa: E501
+
+
+def prompt_template_str_examples() -> None:
+    """
+    Examples for ``PromptTemplate.__str__``.
+
+    >>> print(str(PromptTemplate(functions=[Function(name="foo", description="The foo function.", arguments=[Argument(name="a", type=int, description="The first argument.")], return_type=str, return_description="The return value.")])))
+    Function:
+    def foo(a: int) -> str:
+        \"\"\"
+        The foo function.
+    <BLANKLINE>
+        Args:
+            a (int): The first argument.
+    <BLANKLINE>
+        Returns:
+            str: The return value.
+        \"\"\"
+    <BLANKLINE>
+    User Query: {user_query}
+    """  # noqa: E501